@@ -1,24 +1,26 @@
 #!/usr/bin/python3
 
 from silicontoaster import SiliconToaster
-from time import sleep
-import quicklog
+import json
+import numpy as np
 
-log = quicklog.Log()
-toaster = SiliconToaster("/dev/ttyUSB0")
-toaster.on_off(True)
 avg_count = 100
 
-for width in range(1, 40):
-    toaster.set_pwm_settings(1600, width)
-    input("Waiting...")
-    print("Measuring...")
-    acc = 0
-    for i in range(avg_count):
-        acc += toaster.read_voltage_raw()
-        sleep(0.05)
-    avg = acc / avg_count
-    v = float(input("Voltage: "))
-    record = {"value": avg, "voltage": v}
-    log.append(record)
-    log.flush()
+# Line-buffered so every record hits the disk as soon as it is written:
+# a crash mid-calibration must not lose the keyed-in measurements. The
+# device context manager turns the high voltage back off on every exit
+# path, including a typo in the voltage prompt or a Ctrl-C.
+with open("calibration.log", "a", buffering=1) as log, SiliconToaster(
+    "/dev/ttyUSB0"
+) as toaster:
+    toaster.on_off(True)
+    for width in range(1, 40):
+        toaster.set_pwm_settings(1600, width)
+        input("Waiting...")
+        print("Measuring...")
+        samples = np.asarray(toaster.read_voltage_raw_burst(avg_count), dtype=float)
+        avg = samples.mean()
+        std = samples.std()
+        v = float(input("Voltage: "))
+        record = {"value": avg, "voltage": v, "std": std}
+        log.write(json.dumps(record) + "\n")
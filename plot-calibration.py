@@ -1,49 +1,68 @@
 #!/usr/bin/python3
 
+import json
+
 import matplotlib.pyplot as plt
-import quicklog
 import numpy as np
 
-x = []
-y = []
+try:
+    # Optional numba-compiled kernel for batched polynomial evaluation.
+    from silicontoaster._poly import horner_vec
+
+    def eval_poly(coefs, xs):
+        out = np.empty_like(xs)
+        horner_vec(np.asarray(coefs), xs, out)
+        return out
+
+except ImportError:
+
+    def eval_poly(coefs, xs):
+        return np.polyval(coefs, xs)
 
-plt.figure()
-for record in quicklog.read_log("calibration-800.log"):
-    x.append(float(record["value"]))
-    y.append(float(record["voltage"]))
 
+def fit_batch(values_mat, voltages_mat, deg=4):
+    """
+    Fit one calibration polynomial through several runs at once (e.g. all
+    calibration-*.log files). Stacks every (value, voltage) sample and solves
+    a single least-squares problem instead of looping np.polyfit per run.
+    Polynomial.fit rescales the stacked values internally — an unscaled
+    Vandermonde over raw ADC codes is too ill-conditioned (see above) —
+    and convert() maps the coefficients back to the original domain.
+    Returns descending-order coefficients, like np.polyfit.
+    """
+    values = np.ravel(values_mat)
+    voltages = np.ravel(voltages_mat)
+    fit = np.polynomial.Polynomial.fit(values, voltages, deg)
+    return fit.convert().coef[::-1]
+
+
+with open("calibration-800.log") as f:
+    records = [json.loads(line) for line in f if line.strip()]
+x = np.fromiter((record["value"] for record in records), float)
+y = np.fromiter((record["voltage"] for record in records), float)
+
+plt.figure()
 plt.plot(x, y)
 
-coefs = np.polyfit(x, y, 4)
-poly = np.poly1d(coefs)
+# Polynomial.fit rescales the input domain internally, avoiding the
+# ill-conditioned Vandermonde matrix np.polyfit would build over raw ADC
+# codes. convert() maps the result back to the original domain; reverse to
+# descending order to match the calibration lists in silicontoaster.py.
+coefs = np.polynomial.Polynomial.fit(x, y, 4).convert().coef[::-1]
 print("Raw->Volt", coefs)
 
-coefs_inv = np.polyfit(y, x, 4)
-poly_inv = np.poly1d(coefs_inv)
+coefs_inv = np.polynomial.Polynomial.fit(y, x, 4).convert().coef[::-1]
 print("Volt->Raw", coefs_inv)
 
 plt.figure()
 x = np.linspace(0, max(x), 100)
-y = []
-for xx in x:
-    v = 0
-    for i, c in enumerate(coefs):
-        v += c * xx ** (len(coefs) - i - 1)
-    y.append(v)
+y = eval_poly(coefs, x)
 
 plt.plot(x, y)
-# plt.plot(x, poly(x))
-
 
 y = np.linspace(0, max(y), 100)
-x = []
-for yy in y:
-    v = 0
-    for i, c in enumerate(coefs_inv):
-        v += c * yy ** (len(coefs_inv) - i - 1)
-    x.append(v)
+x = eval_poly(coefs_inv, y)
 
 plt.figure()
 plt.plot(x, y)
-# plt.plot(x, poly_inv(x))
 plt.show()
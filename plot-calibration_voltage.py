@@ -1,19 +1,16 @@
 #!/usr/bin/python3
 
+import json
+
 import matplotlib.pyplot as plt
-import quicklog
 import numpy as np
 from scipy.interpolate import LinearNDInterpolator
 
-x = []
-y = []
-z = []
-
-for record in quicklog.read_log(f"calibration_voltage.log"):
-    x.append(float(record["period"]))
-    y.append(float(record["width"]))
-    z.append(float(record["voltage"]))
-X, Y, Z = [np.array(i) for i in [x, y, z]]
+with open("calibration_voltage.log") as f:
+    records = [json.loads(line) for line in f if line.strip()]
+x = np.fromiter((record["period"] for record in records), float)
+y = np.fromiter((record["width"] for record in records), float)
+z = np.fromiter((record["voltage"] for record in records), float)
 plt.figure()
 ax = plt.axes(projection="3d")
 surf = ax.plot_trisurf(x, y, z, cmap="cool", edgecolor="black")
@@ -4,7 +4,7 @@ setup(
     name="silicon-toaster",
     version="1.1",
     packages=["silicontoaster"],
-    install_requires=["pyserial"],
+    install_requires=["pyserial", "numpy"],
     url="",
     license="GNU LGPL",
     author="Olivier Hérivaux",
@@ -0,0 +1,27 @@
+#!/usr/bin/python3
+"""
+Numba-compiled Horner kernels for batched offline calibration analysis.
+Importing this module requires numba; the serial-device code in
+silicontoaster.py does not depend on it.
+"""
+import numba
+from numba import njit
+
+
+@njit(cache=True, fastmath=True)
+def horner(coefs, x):
+    """Evaluate a polynomial (descending-order coefficients) at a scalar."""
+    v = 0.0
+    for c in coefs:
+        v = v * x + c
+    return v
+
+
+@njit(cache=True, fastmath=True, parallel=True)
+def horner_vec(coefs, xs, out):
+    """Evaluate a polynomial (descending-order coefficients) over an array."""
+    for i in numba.prange(xs.size):
+        v = 0.0
+        for c in coefs:
+            v = v * xs[i] + c
+        out[i] = v
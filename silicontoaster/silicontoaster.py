@@ -1,11 +1,90 @@
 #!/usr/bin/python3
+import os
 import struct
-from typing import Union
+import sys
+import time
+from typing import Callable, Union
+import numpy as np
+from numpy.polynomial import polynomial as npp
 import serial
 import serial.tools.list_ports
 
 
+def _make_poly(coefs: list[float], backend: str = None) -> Callable[[float], float]:
+    """
+    Build a scalar evaluator for descending-order polynomial coefficients,
+    using the given backend (or the module-wide default).
+    """
+    if backend is None:
+        backend = _POLY_BACKEND
+    if backend == "np":
+        poly = np.poly1d(coefs)
+        return lambda x: float(poly(x))
+    if backend == "npp":
+        ascending = np.asarray(coefs)[::-1].copy()
+        return lambda x: float(npp.polyval(x, ascending))
+
+    coefs = [float(c) for c in coefs]
+
+    if len(coefs) == 5:
+        # The calibration polynomials are degree 4; unroll that case so the
+        # evaluator is a single expression with no loop overhead.
+        c0, c1, c2, c3, c4 = coefs
+
+        def horner4(x: float) -> float:
+            return (((c0 * x + c1) * x + c2) * x + c3) * x + c4
+
+        return horner4
+
+    def horner(x: float) -> float:
+        v = 0.0
+        for c in coefs:
+            v = v * x + c
+        return v
+
+    return horner
+
+
+def _choose_poly_backend() -> str:
+    """
+    Select the polynomial-evaluation backend used for the calibration
+    polynomials. numpy 2.0 made scalar polynomial evaluation noticeably
+    slower, so rather than hardcoding one path, time the candidates once at
+    import on a degree-4 polynomial and keep the fastest. The
+    SILICON_TOASTER_POLY_BACKEND environment variable ("horner", "np" or
+    "npp") overrides the measurement.
+    """
+    forced = os.environ.get("SILICON_TOASTER_POLY_BACKEND")
+    if forced is not None:
+        if forced not in ("horner", "np", "npp"):
+            raise ValueError(f"Unknown polynomial backend: {forced}")
+        return forced
+    coefs = [1e-11, 1e-7, 1e-4, 1e-1, 1.0]
+    timings = {}
+    for name in ("horner", "np", "npp"):
+        poly = _make_poly(coefs, name)
+        start = time.perf_counter()
+        for _ in range(1000):
+            poly(1234.5)
+        timings[name] = time.perf_counter() - start
+    return min(timings, key=timings.get)
+
+
+_POLY_BACKEND = _choose_poly_backend()
+
+
 class SiliconToaster:
+    # Precompiled formats for the byte <-> int conversions on the command
+    # paths; struct.Struct caches the parsed format once.
+    _U16 = struct.Struct(">H")
+    _U16U16 = struct.Struct(">HH")
+    _U64 = struct.Struct(">Q")
+
+    # Maximum number of pipelined commands in flight during a burst read.
+    # The firmware buffers incoming commands in a 128-byte queue and panics
+    # if it overflows, so keep the outstanding backlog well below that.
+    _BURST_CHUNK = 64
+
     def __init__(self, dev=None, sn=None):
         if dev is not None and sn is not None:
             raise ValueError("dev and sn cannot be set together")
@@ -30,7 +109,23 @@ class SiliconToaster:
             else:
                 raise RuntimeError("No SiliconToaster device found")
 
-        self.ser = serial.Serial(dev, 9600)
+        self.ser = serial.Serial(dev, 9600, timeout=0.5)
+        if sys.platform.startswith("linux"):
+            # Ask the driver for low-latency mode: FTDI/USB-CDC ports buffer
+            # received bytes for up to 16 ms by default, which stalls every
+            # ack readback. Not all drivers support the ioctl, so best-effort.
+            try:
+                import array
+                import fcntl
+                import termios
+
+                ASYNC_LOW_LATENCY = 0x2000
+                buf = array.array("i", [0] * 32)
+                fcntl.ioctl(self.ser.fd, termios.TIOCGSERIAL, buf)
+                buf[4] |= ASYNC_LOW_LATENCY
+                fcntl.ioctl(self.ser.fd, termios.TIOCSSERIAL, buf)
+            except (ImportError, OSError):
+                pass
         self.calibration_raw_to_v = [
             -4.02294398e-11,
             1.53492378e-07,
@@ -45,6 +140,13 @@ class SiliconToaster:
             1.24457162e00,
             2.57379247e00,
         ]
+        # Raw ADC readings are unsigned 16-bit, so the raw-to-volt polynomial
+        # can be tabulated exhaustively: 65536 float32 entries (256 KiB) turn
+        # to_volt into a single array lookup.
+        self._raw_to_v_table = np.polyval(
+            self.calibration_raw_to_v, np.arange(65536)
+        ).astype(np.float32)
+        self._v_to_raw_poly = _make_poly(self.calibration_v_to_raw)
         self._software_limit = None
         self.set_adc_control_on_off(True)
 
@@ -53,15 +155,15 @@ class SiliconToaster:
         """Converts a value to another according to the calibration coefficients"""
         v = 0.0
         value = float(value)
-        for i, c in enumerate(calibration):
-            v += c * value ** (len(calibration) - i - 1)
+        for c in calibration:
+            v = v * value + c
         return v
 
     def to_raw(self, value: float) -> int:
-        return int(round(self.convert(value, self.calibration_v_to_raw)))
+        return int(round(self._v_to_raw_poly(value)))
 
     def to_volt(self, value: int) -> float:
-        return self.convert(value, self.calibration_raw_to_v)
+        return float(self._raw_to_v_table[value])
 
     def read_voltage_raw(self) -> int:
         """
@@ -71,7 +173,37 @@ class SiliconToaster:
         """
         self.ser.write(b"\x02")
         assert self.ser.read(1) == b"\x02"
-        return int.from_bytes(self.ser.read(2), "big", signed=False)
+        return self._U16.unpack(self.ser.read(2))[0]
+
+    def read_voltage_raw_burst(self, count: int) -> list[int]:
+        """
+        Retrieve multiple raw ADC voltage measurements from the device.
+        The commands are sent back-to-back and the responses drained
+        afterwards, so the USB-serial round-trip latency is paid once per
+        chunk of _BURST_CHUNK commands instead of once per sample. The
+        chunking bounds how many commands are outstanding at once, which
+        the firmware's command queue cannot absorb without limit.
+
+        :param count: Number of measurements to perform.
+        :return: ADC measurements.
+        :rtype: list[int]
+        """
+        values = []
+        while len(values) < count:
+            chunk = min(count - len(values), self._BURST_CHUNK)
+            self.ser.write(b"\x02" * chunk)
+            # The default timeout covers a single ack; give the whole chunk
+            # a proportionally longer one.
+            old_timeout = self.ser.timeout
+            self.ser.timeout = 0.5 + chunk * 0.01
+            try:
+                data = self.ser.read(3 * chunk)
+            finally:
+                self.ser.timeout = old_timeout
+            for i in range(0, 3 * chunk, 3):
+                assert data[i : i + 1] == b"\x02"
+                values.append(self._U16.unpack_from(data, i + 1)[0])
+        return values
 
     def read_voltage(self) -> float:
         """
@@ -110,9 +242,7 @@ class SiliconToaster:
             raise ValueError(
                 "Invalid PWM settings values: width must be lesser than period"
             )
-        command = bytearray(b"\x03")
-        command += period.to_bytes(2, "big", signed=False)
-        command += width.to_bytes(2, "big", signed=False)
+        command = b"\x03" + self._U16U16.pack(period, width)
         self.ser.write(command)
         assert self.ser.read(1) == b"\x03"
 
@@ -124,8 +254,7 @@ class SiliconToaster:
             raise ValueError(
                 f"Invalid software shoot duration: it must be lesser than {0x10000}"
             )
-        command = bytearray(b"\x04")
-        command += duration.to_bytes(2, "big", signed=False)
+        command = b"\x04" + self._U16.pack(duration)
         self.ser.write(command)
         assert self.ser.read(1) == b"\x04"
 
@@ -137,7 +266,7 @@ class SiliconToaster:
         """
         self.ser.write(b"\x05")
         assert self.ser.read(1) == b"\x05"
-        return int.from_bytes(self.ser.read(8), "big")
+        return self._U64.unpack(self.ser.read(8))[0]
 
     def get_voltage_setpoint(self) -> float:
         """
@@ -147,7 +276,7 @@ class SiliconToaster:
         """
         self.ser.write(b"\x06")
         assert self.ser.read(1) == b"\x06"
-        destination = struct.unpack(">H", self.ser.read(2))[0]
+        destination = self._U16.unpack(self.ser.read(2))[0]
         return self.to_volt(destination)
 
     def set_voltage_setpoint(self, destination: float):
@@ -157,7 +286,7 @@ class SiliconToaster:
         :param destination: The desired voltage.
         """
         command = b"\x07"
-        command += struct.pack(">H", self.to_raw(destination))
+        command += self._U16.pack(self.to_raw(destination))
         self.ser.write(command)
         assert self.ser.read(1) == b"\x07"
 
@@ -169,9 +298,7 @@ class SiliconToaster:
         """
         self.ser.write(b"\x08")
         assert self.ser.read(1) == b"\x08"
-        period = int.from_bytes(self.ser.read(2), "big", signed=False)
-        width = int.from_bytes(self.ser.read(2), "big", signed=False)
-        return period, width
+        return self._U16U16.unpack(self.ser.read(4))
 
     def get_adc_control_pid(self, from_flash=False):
         """
@@ -277,7 +404,17 @@ class SiliconToaster:
         command = b"\xEE"
         self.ser.write(command)
         assert self.ser.read(1) == b"\xEE"
-        return int.from_bytes(self.ser.read(2), "big")
+        return self._U16.unpack(self.ser.read(2))[0]
 
-    def __del__(self):
+    def close(self):
+        """
+        Turn off high-voltage generation and close the serial port.
+        """
         self.on_off(False)
+        self.ser.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()